@@ -1,11 +1,30 @@
 """Claude Code Designer - A CLI tool for generating project documentation using Claude Code SDK."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Anthropic"
 __email__ = "support@anthropic.com"
 
-from .conversation_evaluator import ConversationEvaluator
-from .design_assistant import DesignAssistant
-from .save_claude_conversation import ConversationSaver
+if TYPE_CHECKING:
+    from .conversation_evaluator import ConversationEvaluator
+    from .design_assistant import DesignAssistant
+    from .save_claude_conversation import ConversationSaver
 
 __all__ = ["__version__", "__author__", "__email__", "DesignAssistant", "ConversationSaver", "ConversationEvaluator"]
+
+# Public classes are imported on first access so that importing the package
+# (e.g. for the CLI's --help) does not pull in claude_code_sdk up front
+_LAZY_EXPORTS = {
+    "ConversationEvaluator": ".conversation_evaluator",
+    "DesignAssistant": ".design_assistant",
+    "ConversationSaver": ".save_claude_conversation",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,14 +13,23 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 
-from .conversation_evaluator import ConversationEvaluator
-from .design_assistant import DesignAssistant
-from .learning_system import LearningSystem
-from .simulator import DesignSimulator
+# Command implementations (and claude_code_sdk) are imported inside each
+# command so that --help and unrelated commands start quickly
 
 console = Console()
 
 
+def _run_async(coro, interrupted_message: str):
+    """Run a command coroutine, reporting interrupts and errors consistently."""
+    try:
+        return asyncio.run(coro)
+    except KeyboardInterrupt:
+        console.print(f"\n❌ {interrupted_message}")
+    except Exception as e:
+        console.print(f"❌ Error: {e}")
+    return None
+
+
 @click.group()
 @click.option(
     "--conversation-dir",
@@ -31,7 +40,7 @@ console = Console()
 def cli(ctx, conversation_dir):
     """Claude Code Design Assistant - Help design applications and features."""
     ctx.ensure_object(dict)
-    ctx.obj["assistant"] = DesignAssistant(conversation_dir)
+    ctx.obj["conversation_dir"] = conversation_dir
 
 
 @cli.command()
@@ -47,26 +56,24 @@ def app(ctx, name, project_type, project_description, max_turns, non_interactive
     """Design a new application."""
     console.print(Panel.fit("🚀 Application Design Assistant", style="bold blue"))
 
-    assistant = ctx.obj["assistant"]
+    from .design_assistant import DesignAssistant
 
-    async def run_design():
-        return await assistant.design_application(
+    assistant = DesignAssistant(ctx.obj["conversation_dir"])
+
+    conversation = _run_async(
+        assistant.design_application(
             project_name=name,
             project_type=project_type,
             project_description=project_description,
             interactive=not non_interactive,
             max_turns=max_turns,
-        )
-
-    try:
-        conversation = asyncio.run(run_design())
+        ),
+        "Design session interrupted by user",
+    )
+    if conversation is not None:
         console.print(
             f"✅ Design session completed with {conversation['output']['message_count']} messages"
         )
-    except KeyboardInterrupt:
-        console.print("\n❌ Design session interrupted by user")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
 
 
 @cli.command()
@@ -79,25 +86,23 @@ def feature(ctx, description, context, max_turns, non_interactive):
     """Design a new feature for an existing project."""
     console.print(Panel.fit("⚡ Feature Design Assistant", style="bold green"))
 
-    assistant = ctx.obj["assistant"]
+    from .design_assistant import DesignAssistant
+
+    assistant = DesignAssistant(ctx.obj["conversation_dir"])
 
-    async def run_design():
-        return await assistant.design_feature(
+    conversation = _run_async(
+        assistant.design_feature(
             feature_description=description,
             project_context=context,
             interactive=not non_interactive,
             max_turns=max_turns,
-        )
-
-    try:
-        conversation = asyncio.run(run_design())
+        ),
+        "Feature design interrupted by user",
+    )
+    if conversation is not None:
         console.print(
             f"✅ Feature design completed with {conversation['output']['message_count']} messages"
         )
-    except KeyboardInterrupt:
-        console.print("\n❌ Feature design interrupted by user")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
 
 
 @cli.command()
@@ -129,11 +134,31 @@ def list_conversations(conversation_dir):
     "--evaluation-dir", default="./evaluations", help="Directory to save evaluations"
 )
 @click.option("--conversation-file", help="Evaluate specific conversation file")
-def evaluate(conversation_dir, evaluation_dir, conversation_file):
+@click.option(
+    "--cache-dir",
+    help="Directory to cache evaluation responses for identical prompts",
+)
+@click.option(
+    "--max-concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Maximum number of conversations evaluated at the same time",
+)
+def evaluate(
+    conversation_dir, evaluation_dir, conversation_file, cache_dir, max_concurrency
+):
     """Evaluate conversation quality and agent performance."""
     console.print(Panel.fit("📊 Conversation Evaluator", style="bold purple"))
 
-    evaluator = ConversationEvaluator(conversation_dir, evaluation_dir)
+    from .conversation_evaluator import ConversationEvaluator
+    from .json_utils import write_json_file
+
+    evaluator = ConversationEvaluator(
+        conversation_dir,
+        evaluation_dir,
+        max_concurrency=max_concurrency,
+        cache_dir=cache_dir,
+    )
 
     async def run_evaluation():
         if conversation_file:
@@ -148,10 +173,7 @@ def evaluate(conversation_dir, evaluation_dir, conversation_file):
             # Save evaluation
             eval_file = Path(evaluation_dir) / f"{file_path.stem}_evaluation.json"
             eval_file.parent.mkdir(exist_ok=True)
-            with open(eval_file, "w", encoding="utf-8") as f:
-                import json
-
-                json.dump(evaluation, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(write_json_file, eval_file, evaluation)
 
             console.print(f"✅ Evaluation completed: {eval_file.name}")
         else:
@@ -165,12 +187,7 @@ def evaluate(conversation_dir, evaluation_dir, conversation_file):
             else:
                 console.print("❌ No conversations found to evaluate")
 
-    try:
-        asyncio.run(run_evaluation())
-    except KeyboardInterrupt:
-        console.print("\n❌ Evaluation interrupted by user")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
+    _run_async(run_evaluation(), "Evaluation interrupted by user")
 
 
 @cli.command()
@@ -220,23 +237,21 @@ def simulate(
     """Run automated design simulation and evaluation cycles."""
     console.print(Panel.fit("🔬 Design Assistant Simulator", style="bold cyan"))
 
+    from .simulator import DesignSimulator
+
     simulator = DesignSimulator(
         conversation_dir, evaluation_dir, results_dir, learning_dir, enable_learning
     )
 
-    async def run_simulation():
-        return await simulator.run_simulation_loop(
+    results = _run_async(
+        simulator.run_simulation_loop(
             max_cycles=cycles, delay_seconds=delay, scenario_type=scenario_type
-        )
-
-    try:
-        results = asyncio.run(run_simulation())
+        ),
+        "Simulation interrupted by user",
+    )
+    if results is not None:
         console.print(f"✅ Simulation completed with {len(results)} cycles")
         console.print(f"📁 Results saved to: {results_dir}")
-    except KeyboardInterrupt:
-        console.print("\n❌ Simulation interrupted by user")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
 
 
 @cli.command()
@@ -254,6 +269,8 @@ def learn(knowledge_dir, evaluation_dir):
     """Manually trigger learning from existing evaluation files."""
     console.print(Panel.fit("🧠 Learning System", style="bold magenta"))
 
+    from .learning_system import LearningSystem
+
     learning_system = LearningSystem(knowledge_dir, evaluation_dir)
 
     async def run_learning():
@@ -272,12 +289,7 @@ def learn(knowledge_dir, evaluation_dir):
             for rule_type, count in stats["rule_types"].items():
                 console.print(f"     - {rule_type}: {count}")
 
-    try:
-        asyncio.run(run_learning())
-    except KeyboardInterrupt:
-        console.print("\n❌ Learning interrupted by user")
-    except Exception as e:
-        console.print(f"❌ Error: {e}")
+    _run_async(run_learning(), "Learning interrupted by user")
 
 
 @cli.command()
@@ -290,6 +302,8 @@ def knowledge_stats(knowledge_dir):
     """Show learning system knowledge base statistics."""
     console.print(Panel.fit("📚 Knowledge Base Statistics", style="bold blue"))
 
+    from .learning_system import LearningSystem
+
     learning_system = LearningSystem(knowledge_dir)
     stats = learning_system.get_knowledge_stats()
 
@@ -7,25 +7,74 @@ and alignment with user requests using the conversation-evaluator subagent.
 """
 
 import asyncio
+import hashlib
 import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from claude_code_sdk import ClaudeCodeOptions, Message, query
 
+from .json_utils import load_json_file, write_json_file
+
 
 class ConversationEvaluator:
     """Evaluates saved conversations for agent performance and response quality."""
 
+    EVALUATION_INSTRUCTIONS = """Please analyze this conversation for agent performance and quality. Use the conversation-evaluator for the evaluation.
+
+Focus on providing:
+1. Specific scores (1-10) for each evaluation criterion
+2. Concrete examples from the conversation
+3. Actionable improvement recommendations
+4. Assessment of whether the agent met user expectations
+
+Use your expertise in conversation analysis to provide objective, constructive feedback."""
+
+    EVALUATION_CRITERIA = """Please evaluate this conversation between a user and an AI design assistant.
+
+## Evaluation Criteria:
+
+Please analyze and provide scores (1-10) and explanations for:
+
+1. **Request Fulfillment** (1-10): Did the agent address what the user asked for?
+2. **Response Quality** (1-10): Was the guidance helpful, accurate, and well-structured?
+3. **Appropriateness** (1-10): Were the responses appropriate for the context and request?
+4. **Completeness** (1-10): Did the agent provide comprehensive assistance?
+5. **Communication Style** (1-10): Was the communication clear and professional?
+
+## Additional Analysis:
+- What did the agent do well?
+- What could be improved?
+- Were there any concerning responses or behaviors?
+- Did the conversation achieve its intended purpose?
+
+Please provide your evaluation in a structured format with scores and detailed explanations.
+The conversation to evaluate follows below."""
+
     def __init__(
         self,
         conversation_dir: str = "./conversations",
         evaluation_dir: str = "./evaluations",
+        max_concurrency: int = 4,
+        cache_dir: str | None = None,
     ):
         self.conversation_dir = Path(conversation_dir)
         self.evaluation_dir = Path(evaluation_dir)
         self.evaluation_dir.mkdir(exist_ok=True)
+        self.max_concurrency = max_concurrency
+
+        # Every evaluation uses the same options, so build them once and reuse
+        self.options = ClaudeCodeOptions(
+            max_turns=5,
+        )
+
+        # Optional on-disk cache of evaluation responses keyed by prompt hash
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     async def evaluate_conversation(self, conversation_file: Path) -> dict[str, Any]:
         """
@@ -40,16 +89,36 @@ class ConversationEvaluator:
         print(f"Evaluating conversation: {conversation_file.name}")
 
         # Load the conversation data
-        with open(conversation_file, encoding="utf-8") as f:
-            conversation_data = json.load(f)
+        conversation_data = load_json_file(conversation_file)
 
+        return await self.evaluate_conversation_data(
+            conversation_data, conversation_file.stem
+        )
+
+    async def evaluate_conversation_data(
+        self, conversation_data: dict[str, Any], conversation_id: str
+    ) -> dict[str, Any]:
+        """
+        Evaluate conversation data that is already in memory.
+
+        Args:
+            conversation_data: Conversation data as returned by ConversationSaver
+            conversation_id: Identifier for the conversation (its file stem)
+
+        Returns:
+            Dictionary containing evaluation results
+        """
         # Build evaluation prompt
         evaluation_prompt = self._build_evaluation_prompt(conversation_data)
 
+        # A session that produced no messages has nothing to evaluate, so skip
+        # the LLM round trip entirely
+        if not conversation_data.get("output", {}).get("messages"):
+            print(f"Skipping empty conversation: {conversation_id}")
+            return self._build_evaluation_result(conversation_id, evaluation_prompt, [])
+
         # Use Task tool to launch conversation-evaluator subagent
-        return await self._run_evaluation_task(
-            evaluation_prompt, conversation_file.stem
-        )
+        return await self._run_evaluation_task(evaluation_prompt, conversation_id)
 
     async def evaluate_all_conversations(self) -> list[dict[str, Any]]:
         """
@@ -69,22 +138,13 @@ class ConversationEvaluator:
 
         print(f"📋 Evaluating {len(json_files)} conversations...")
 
-        evaluations = []
-        for file in sorted(json_files):
-            try:
-                evaluation = await self.evaluate_conversation(file)
-                evaluations.append(evaluation)
-
-                # Save individual evaluation
-                evaluation_file = self.evaluation_dir / f"{file.stem}_evaluation.json"
-                with open(evaluation_file, "w", encoding="utf-8") as f:
-                    json.dump(evaluation, f, indent=2, ensure_ascii=False)
-
-                print(f"✅ Evaluation saved: {evaluation_file.name}")
-
-            except Exception as e:
-                print(f"❌ Error evaluating {file.name}: {e}")
-                continue
+        # Evaluations are independent LLM calls, so run them concurrently
+        # (bounded to avoid spawning too many Claude sessions at once)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._evaluate_and_save(file, semaphore) for file in sorted(json_files))
+        )
+        evaluations = [evaluation for evaluation in results if evaluation is not None]
 
         # Save summary evaluation
         summary = self._create_evaluation_summary(evaluations)
@@ -92,25 +152,47 @@ class ConversationEvaluator:
             self.evaluation_dir
             / f"evaluation_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         )
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, summary_file, summary)
 
         print(f"📊 Summary evaluation saved: {summary_file.name}")
         return evaluations
 
+    async def _evaluate_and_save(
+        self, file: Path, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any] | None:
+        """Evaluate a single conversation and save it, returning None on failure."""
+        async with semaphore:
+            try:
+                evaluation = await self.evaluate_conversation(file)
+
+                # Save individual evaluation
+                evaluation_file = self.evaluation_dir / f"{file.stem}_evaluation.json"
+                # Write off the event loop so concurrent evaluations keep streaming
+                await asyncio.to_thread(write_json_file, evaluation_file, evaluation)
+
+                print(f"✅ Evaluation saved: {evaluation_file.name}")
+                return evaluation
+
+            except Exception as e:
+                print(f"❌ Error evaluating {file.name}: {e}")
+                return None
+
     def _build_evaluation_prompt(self, conversation_data: dict[str, Any]) -> str:
         """Build the evaluation prompt for the conversation-evaluator subagent."""
         input_data = conversation_data.get("input", {})
+        input_options = input_data.get("options", {})
         output_data = conversation_data.get("output", {})
         messages = output_data.get("messages", [])
 
+        # Static criteria come first so every evaluation shares the same prompt
+        # prefix; only the conversation-specific details vary at the end
         prompt_parts = [
-            "Please evaluate this conversation between a user and an AI design assistant.",
+            self.EVALUATION_CRITERIA,
             "",
             "## Original User Request:",
             f"Prompt: {input_data.get('prompt', 'Not available')}",
-            f"Max turns: {input_data.get('options', {}).get('max_turns', 'Not specified')}",
-            f"System prompt: {input_data.get('options', {}).get('system_prompt', 'Default used')}",
+            f"Max turns: {input_options.get('max_turns', 'Not specified')}",
+            f"System prompt: {input_options.get('system_prompt', 'Default used')}",
             "",
             "## Conversation Messages:",
         ]
@@ -128,29 +210,6 @@ class ConversationEvaluator:
 
         if len(messages) > 10:
             prompt_parts.append(f"[{len(messages) - 10} additional messages not shown]")
-            prompt_parts.append("")
-
-        prompt_parts.extend(
-            [
-                "## Evaluation Criteria:",
-                "",
-                "Please analyze and provide scores (1-10) and explanations for:",
-                "",
-                "1. **Request Fulfillment** (1-10): Did the agent address what the user asked for?",
-                "2. **Response Quality** (1-10): Was the guidance helpful, accurate, and well-structured?",
-                "3. **Appropriateness** (1-10): Were the responses appropriate for the context and request?",
-                "4. **Completeness** (1-10): Did the agent provide comprehensive assistance?",
-                "5. **Communication Style** (1-10): Was the communication clear and professional?",
-                "",
-                "## Additional Analysis:",
-                "- What did the agent do well?",
-                "- What could be improved?",
-                "- Were there any concerning responses or behaviors?",
-                "- Did the conversation achieve its intended purpose?",
-                "",
-                "Please provide your evaluation in a structured format with scores and detailed explanations.",
-            ]
-        )
 
         return "\n".join(prompt_parts)
 
@@ -160,29 +219,79 @@ class ConversationEvaluator:
         """Run the evaluation using the conversation-evaluator subagent via Task tool."""
         print(f"Running evaluation task for: {conversation_id}")
 
-        messages: list[Message] = []
-
         # Use the conversation-evaluator subagent optimized prompt
-        optimized_prompt = f"""Please analyze this conversation for agent performance and quality. Use the conversation-evaluator for the evaluation.
+        optimized_prompt = f"{self.EVALUATION_INSTRUCTIONS}\n\n{evaluation_prompt}"
 
-{evaluation_prompt}
+        evaluation_messages = await self._cached_query(optimized_prompt, self.options)
 
-Focus on providing:
-1. Specific scores (1-10) for each evaluation criterion
-2. Concrete examples from the conversation
-3. Actionable improvement recommendations
-4. Assessment of whether the agent met user expectations
+        return self._build_evaluation_result(
+            conversation_id, evaluation_prompt, evaluation_messages
+        )
 
-Use your expertise in conversation analysis to provide objective, constructive feedback."""
+    def _build_evaluation_result(
+        self,
+        conversation_id: str,
+        evaluation_prompt: str,
+        evaluation_messages: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Structure the evaluation result."""
+        return {
+            "conversation_id": conversation_id,
+            "timestamp": datetime.now().isoformat(),
+            "evaluation_prompt": evaluation_prompt,
+            "evaluation_messages": evaluation_messages,
+            "message_count": len(evaluation_messages),
+            "subagent_used": "conversation-evaluator",
+        }
 
-        options = ClaudeCodeOptions(
-            max_turns=5,
+    async def _cached_query(
+        self, prompt: str, options: ClaudeCodeOptions
+    ) -> list[dict[str, Any]]:
+        """Query Claude, reusing the cached response for an identical prompt."""
+        if self.cache_dir is None:
+            messages, _ = await self._query_messages(prompt, options)
+            return messages
+
+        payload = json.dumps(
+            {"prompt": prompt, "max_turns": options.max_turns}, sort_keys=True
         )
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        cache_file = self.cache_dir / f"{key}.json"
+
+        if cache_file.exists():
+            try:
+                return load_json_file(cache_file)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Ignoring unreadable cache entry {cache_file.name}: {e}")
+
+        messages, completed = await self._query_messages(prompt, options)
+
+        # Only cache complete responses so failed or interrupted runs are retried
+        if completed and messages:
+            await asyncio.to_thread(self._store_cache_entry, cache_file, messages)
+
+        return messages
+
+    def _store_cache_entry(self, cache_file: Path, messages: list[dict[str, Any]]):
+        """Atomically write a cache entry so readers never see partial files."""
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(messages, f, ensure_ascii=False)
+        os.replace(f.name, cache_file)
+
+    async def _query_messages(
+        self, prompt: str, options: ClaudeCodeOptions
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Stream a query and return serialized messages and whether it completed."""
+        messages: list[Message] = []
+        completed = False
 
         try:
-            async for message in query(prompt=optimized_prompt, options=options):
+            async for message in query(prompt=prompt, options=options):
                 messages.append(message)
                 print(f"Received evaluation message: {type(message).__name__}")
+            completed = True
 
         except KeyboardInterrupt:
             print("\\nEvaluation interrupted by user")
@@ -190,26 +299,15 @@ Use your expertise in conversation analysis to provide objective, constructive f
             print(f"Error during evaluation: {e}")
             raise
 
-        # Structure the evaluation result
-        evaluation_result = {
-            "conversation_id": conversation_id,
-            "timestamp": datetime.now().isoformat(),
-            "evaluation_prompt": evaluation_prompt,
-            "evaluation_messages": [
-                {
-                    "type": type(msg).__name__,
-                    "content": str(msg.content)
-                    if hasattr(msg, "content")
-                    else str(msg),
-                    "metadata": self._serialize_message_metadata(msg),
-                }
-                for msg in messages
-            ],
-            "message_count": len(messages),
-            "subagent_used": "conversation-evaluator",
-        }
-
-        return evaluation_result
+        serialized = [
+            {
+                "type": type(msg).__name__,
+                "content": str(getattr(msg, "content", msg)),
+                "metadata": self._serialize_message_metadata(msg),
+            }
+            for msg in messages
+        ]
+        return serialized, completed
 
     def _serialize_message_metadata(self, msg: Message) -> dict[str, Any]:
         """Safely serialize message metadata to JSON-compatible format."""
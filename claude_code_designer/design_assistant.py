@@ -17,17 +17,32 @@ from .save_claude_conversation import ConversationSaver
 class DesignAssistant:
     """Core design assistant functionality that can be used programmatically."""
 
+    APP_DESIGNER_INSTRUCTIONS = """I need comprehensive application design assistance. Use the {subagent_type} to create the design.
+
+Please provide:
+1. Complete architecture recommendations
+2. Technology stack selection with rationale
+3. Project structure and organization
+4. Implementation guidance and best practices
+5. Essential documentation (PRD.md, CLAUDE.md, README.md if applicable)
+
+Follow KISS > SOLID > DRY principles and focus on maintainability over complexity.
+Do not start implementing the feature yet."""
+
     def __init__(
         self, 
         conversation_dir: str = "./conversations",
         enable_learning: bool = True,
-        learning_knowledge_dir: str = "./learning_knowledge"
+        learning_knowledge_dir: str = "./learning_knowledge",
+        learning_system: LearningSystem | None = None
     ):
         self.saver = ConversationSaver(conversation_dir)
         self.enable_learning = enable_learning
         
         if enable_learning:
-            self.learning_system = LearningSystem(
+            # Reuse a caller-provided learning system so rules it learns are
+            # applied immediately instead of living in a separate copy
+            self.learning_system = learning_system or LearningSystem(
                 knowledge_dir=learning_knowledge_dir,
                 evaluation_dir=conversation_dir.replace("conversations", "evaluations")
             )
@@ -202,28 +217,21 @@ class DesignAssistant:
         project_type: str = "web"
     ) -> str:
         """Optimize the prompt for the specific subagent type with learned improvements."""
-        base_prompt = prompt
-        
+        # Keep the static instructions (and learned rules) ahead of the
+        # request-specific prompt so sessions share a common prompt prefix
+        instructions = ""
         if subagent_type == "app-designer":
-            base_prompt = f"""I need comprehensive application design assistance. Use the {subagent_type} to create the design.
-
-{prompt}
-
-Please provide:
-1. Complete architecture recommendations
-2. Technology stack selection with rationale
-3. Project structure and organization
-4. Implementation guidance and best practices
-5. Essential documentation (PRD.md, CLAUDE.md, README.md if applicable)
+            instructions = self.APP_DESIGNER_INSTRUCTIONS.format(
+                subagent_type=subagent_type
+            )
 
-Follow KISS > SOLID > DRY principles and focus on maintainability over complexity.
-Do not start implementing the feature yet."""
-        
         # Apply learned improvements if learning is enabled
         if self.enable_learning and self.learning_system:
-            enhanced_prompt = self.learning_system.get_enhanced_prompt(
-                base_prompt, scenario_type, project_type
-            )
-            return enhanced_prompt
-        
-        return base_prompt
+            instructions = self.learning_system.get_enhanced_prompt(
+                instructions, scenario_type, project_type
+            ).strip()
+
+        if not instructions:
+            return prompt
+
+        return f"{instructions}\n\n{prompt}"
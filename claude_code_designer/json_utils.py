@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+JSON File Helpers
+
+Shared helpers for reading and writing the JSON files used across the design
+assistant. Kept free of claude_code_sdk imports so any module can use them.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON parser
+    orjson = None
+
+
+def load_json_file(file_path: Path) -> Any:
+    """Load a JSON file, using orjson for faster parsing when it is installed."""
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_file(file_path: Path, data: Any):
+    """Write data to a JSON file in the project's indented format."""
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -6,18 +6,32 @@ Analyzes evaluation results to extract patterns and automatically improve
 the design assistant through iterative learning and prompt optimization.
 """
 
+import asyncio
 import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .conversation_evaluator import ConversationEvaluator
+from .json_utils import load_json_file
 
 
 class LearningRule:
     """Represents a learned rule or pattern for improving design quality."""
     
+    # Rules are loaded in bulk from the knowledge base, so avoid a per-instance dict
+    __slots__ = (
+        "rule_id",
+        "rule_type",
+        "condition",
+        "action",
+        "confidence",
+        "examples",
+        "created_at",
+        "usage_count",
+        "success_rate",
+    )
+    
     def __init__(
         self,
         rule_id: str,
@@ -72,30 +86,57 @@ class LearningRule:
 class LearningRuleExtractor:
     """Extracts learning rules from evaluation results and conversation patterns."""
     
-    def __init__(self):
-        # Pre-defined patterns for common issues and improvements
-        self.issue_patterns = {
-            "missing_architecture": [
-                r"architecture.*not.*discussed",
-                r"lack.*architectural.*guidance", 
-                r"missing.*technology.*choices"
-            ],
-            "insufficient_detail": [
-                r"too.*vague",
-                r"needs.*more.*detail",
-                r"lacks.*specific.*guidance"
-            ],
-            "missing_best_practices": [
-                r"best.*practices.*not.*mentioned",
-                r"security.*considerations.*missing",
-                r"testing.*strategy.*absent"
-            ],
-            "poor_question_flow": [
-                r"questions.*not.*relevant",
-                r"follow.*up.*questions.*needed",
-                r"clarification.*required"
-            ]
+    RULE_TEMPLATES = {
+        "missing_architecture": {
+            "action": "Always discuss architectural patterns, technology choices, and scalability considerations",
+            "confidence": 0.9
+        },
+        "insufficient_detail": {
+            "action": "Provide concrete examples, code snippets, and step-by-step implementation guidance",
+            "confidence": 0.85
+        },
+        "missing_best_practices": {
+            "action": "Include security best practices, testing strategies, and performance considerations",
+            "confidence": 0.8
+        },
+        "poor_question_flow": {
+            "action": "Ask more targeted follow-up questions based on user responses and project context",
+            "confidence": 0.75
         }
+    }
+    
+    # Pre-defined patterns for common issues and improvements
+    ISSUE_PATTERNS = {
+        "missing_architecture": [
+            r"architecture.*not.*discussed",
+            r"lack.*architectural.*guidance", 
+            r"missing.*technology.*choices"
+        ],
+        "insufficient_detail": [
+            r"too.*vague",
+            r"needs.*more.*detail",
+            r"lacks.*specific.*guidance"
+        ],
+        "missing_best_practices": [
+            r"best.*practices.*not.*mentioned",
+            r"security.*considerations.*missing",
+            r"testing.*strategy.*absent"
+        ],
+        "poor_question_flow": [
+            r"questions.*not.*relevant",
+            r"follow.*up.*questions.*needed",
+            r"clarification.*required"
+        ]
+    }
+    
+    # Each issue type's patterns compiled once per process into a single
+    # case-insensitive regex, so the evaluation text is scanned once per type
+    COMPILED_ISSUE_PATTERNS = {
+        issue_type: re.compile(
+            "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE
+        )
+        for issue_type, patterns in ISSUE_PATTERNS.items()
+    }
     
     async def extract_rules_from_evaluations(
         self,
@@ -128,19 +169,18 @@ class LearningRuleExtractor:
         rules = []
         
         # Analyze evaluation messages for patterns
-        evaluation_text = ""
-        if "evaluation_messages" in evaluation:
-            for msg in evaluation["evaluation_messages"]:
-                if isinstance(msg, dict) and "content" in msg:
-                    evaluation_text += msg["content"] + " "
+        evaluation_text = " ".join(
+            msg["content"]
+            for msg in evaluation.get("evaluation_messages", [])
+            if isinstance(msg, dict) and "content" in msg
+        )
         
         # Check for common improvement patterns
-        for issue_type, patterns in self.issue_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, evaluation_text, re.IGNORECASE):
-                    rule = self._create_improvement_rule(issue_type, evaluation)
-                    if rule:
-                        rules.append(rule)
+        for issue_type, pattern in self.COMPILED_ISSUE_PATTERNS.items():
+            if pattern.search(evaluation_text):
+                rule = self._create_improvement_rule(issue_type, evaluation)
+                if rule:
+                    rules.append(rule)
         
         return rules
     
@@ -190,26 +230,7 @@ class LearningRuleExtractor:
         """Create a learning rule for a specific issue type."""
         scenario = evaluation.get("scenario", {})
         
-        rule_templates = {
-            "missing_architecture": {
-                "action": "Always discuss architectural patterns, technology choices, and scalability considerations",
-                "confidence": 0.9
-            },
-            "insufficient_detail": {
-                "action": "Provide concrete examples, code snippets, and step-by-step implementation guidance",
-                "confidence": 0.85
-            },
-            "missing_best_practices": {
-                "action": "Include security best practices, testing strategies, and performance considerations",
-                "confidence": 0.8
-            },
-            "poor_question_flow": {
-                "action": "Ask more targeted follow-up questions based on user responses and project context",
-                "confidence": 0.75
-            }
-        }
-        
-        template = rule_templates.get(issue_type)
+        template = self.RULE_TEMPLATES.get(issue_type)
         if not template:
             return None
         
@@ -257,9 +278,8 @@ class KnowledgeBase:
         """Load existing rules from storage."""
         if self.rules_file.exists():
             try:
-                with open(self.rules_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.rules = [LearningRule.from_dict(rule_data) for rule_data in data.get("rules", [])]
+                data = load_json_file(self.rules_file)
+                self.rules = [LearningRule.from_dict(rule_data) for rule_data in data.get("rules", [])]
             except Exception as e:
                 print(f"Error loading rules: {e}")
                 self.rules = []
@@ -311,13 +331,17 @@ class KnowledgeBase:
         """Get rules applicable to a specific scenario."""
         applicable = []
         
+        # Build the condition strings once rather than for every rule
+        scenario_condition = f"scenario_type == '{scenario_type}'"
+        project_condition = f"project_type == '{project_type}'"
+        
         for rule in self.rules:
             if rule.confidence < min_confidence:
                 continue
             
             # Simple condition matching (can be enhanced with more complex logic)
-            if (f"scenario_type == '{scenario_type}'" in rule.condition or
-                f"project_type == '{project_type}'" in rule.condition or
+            if (scenario_condition in rule.condition or
+                project_condition in rule.condition or
                 rule.condition == "always"):
                 applicable.append(rule)
         
@@ -379,21 +403,21 @@ class DesignAgentUpdater:
             elif rule.rule_type == "behavior_change":
                 behavior_changes.append(f"- {rule.action}")
         
-        enhanced_prompt = base_prompt
+        sections = [base_prompt]
         
         if prompt_additions:
-            enhanced_prompt += f"""
-
-LEARNED IMPROVEMENTS (apply these based on previous feedback):
-{chr(10).join(prompt_additions)}"""
+            sections.append(
+                "LEARNED IMPROVEMENTS (apply these based on previous feedback):\n"
+                + "\n".join(prompt_additions)
+            )
         
         if behavior_changes:
-            enhanced_prompt += f"""
-
-BEHAVIOR GUIDELINES (learned from past evaluations):
-{chr(10).join(behavior_changes)}"""
+            sections.append(
+                "BEHAVIOR GUIDELINES (learned from past evaluations):\n"
+                + "\n".join(behavior_changes)
+            )
         
-        return enhanced_prompt
+        return "\n\n".join(sections)
     
     def get_dynamic_instructions(
         self,
@@ -438,15 +462,11 @@ class LearningSystem:
         
         print(f"Learning from {len(evaluation_files)} evaluation files...")
         
-        # Load evaluations
-        evaluations = []
-        for file in evaluation_files:
-            try:
-                with open(file, "r", encoding="utf-8") as f:
-                    evaluation = json.load(f)
-                    evaluations.append(evaluation)
-            except Exception as e:
-                print(f"Error loading {file}: {e}")
+        # Load evaluations concurrently without blocking the event loop
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._load_evaluation, file) for file in evaluation_files)
+        )
+        evaluations = [evaluation for evaluation in results if evaluation is not None]
         
         if not evaluations:
             print("No valid evaluations loaded")
@@ -465,6 +485,14 @@ class LearningSystem:
         else:
             print("No new learning rules extracted")
     
+    def _load_evaluation(self, file: Path) -> dict[str, Any] | None:
+        """Load a single evaluation file, returning None if it can't be read."""
+        try:
+            return load_json_file(file)
+        except Exception as e:
+            print(f"Error loading {file}: {e}")
+            return None
+    
     def get_enhanced_prompt(
         self,
         base_prompt: str,
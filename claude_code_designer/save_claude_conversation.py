@@ -29,6 +29,11 @@ class ConversationSaver:
         prompt_preview = "_".join(prompt_preview.split())
         return f"{timestamp}_{prompt_preview}.json"
 
+    def _write_conversation(self, filepath: Path, conversation_data: dict[str, Any]):
+        """Write conversation data to a JSON file."""
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+
     async def save_conversation(
         self,
         prompt: str,
@@ -83,9 +88,7 @@ class ConversationSaver:
                 "messages": [
                     {
                         "type": type(msg).__name__,
-                        "content": str(msg.content)
-                        if hasattr(msg, "content")
-                        else str(msg),
+                        "content": str(getattr(msg, "content", msg)),
                         "metadata": getattr(msg, "__dict__", {}),
                     }
                     for msg in messages
@@ -96,10 +99,13 @@ class ConversationSaver:
         filename = self._generate_filename(prompt)
         filepath = self.output_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+        # Write off the event loop so other running sessions are not blocked
+        await anyio.to_thread.run_sync(
+            self._write_conversation, filepath, conversation_data
+        )
 
         print(f"Conversation saved to: {filepath}")
+        conversation_data["file_path"] = str(filepath)
         return conversation_data
 
 
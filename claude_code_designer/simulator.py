@@ -7,7 +7,6 @@ the design assistant through continuous evaluation and feedback loops.
 """
 
 import asyncio
-import json
 import random
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,7 @@ from typing import Any
 
 from .conversation_evaluator import ConversationEvaluator
 from .design_assistant import DesignAssistant
+from .json_utils import write_json_file
 from .learning_system import LearningSystem
 
 
@@ -179,23 +179,26 @@ class DesignSimulator:
         self.learning_knowledge_dir.mkdir(exist_ok=True)
 
         # Initialize components
+        if enable_learning:
+            self.learning_system = LearningSystem(
+                str(self.learning_knowledge_dir), str(self.evaluation_dir)
+            )
+        else:
+            self.learning_system = None
+
+        # Share one learning system so rules learned in a cycle reach the
+        # design assistant in the next cycle without reloading from disk
         self.design_assistant = DesignAssistant(
             str(self.conversation_dir),
             enable_learning=enable_learning,
             learning_knowledge_dir=str(self.learning_knowledge_dir),
+            learning_system=self.learning_system,
         )
         self.evaluator = ConversationEvaluator(
             str(self.conversation_dir), str(self.evaluation_dir)
         )
         self.scenario_generator = ScenarioGenerator()
 
-        if enable_learning:
-            self.learning_system = LearningSystem(
-                str(self.learning_knowledge_dir), str(self.evaluation_dir)
-            )
-        else:
-            self.learning_system = None
-
     async def run_single_cycle(
         self, scenario: TestScenario | None = None
     ) -> dict[str, Any]:
@@ -239,8 +242,9 @@ class DesignSimulator:
             print("  📊 Evaluating conversation...")
             conversation_file = Path(design_result["file_path"])
             if conversation_file.exists():
-                evaluation_result = await self.evaluator.evaluate_conversation(
-                    conversation_file
+                # The conversation is already in memory, so don't re-read it
+                evaluation_result = await self.evaluator.evaluate_conversation_data(
+                    design_result, conversation_file.stem
                 )
                 cycle_results["evaluation"] = evaluation_result
 
@@ -337,8 +341,7 @@ class DesignSimulator:
             "summary": self._generate_summary_stats(results),
         }
 
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, results_file, summary)
 
     def _generate_summary_stats(self, results: list[dict[str, Any]]) -> dict[str, Any]:
         """Generate summary statistics from simulation results."""